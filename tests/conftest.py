@@ -9,6 +9,11 @@ import pandas as pd
 import pytest
 
 
+def frame(body: str) -> str:
+    """Wrap a message body in TradingView's ``~m~<len>~m~`` framing."""
+    return f"~m~{len(body)}~m~{body}"
+
+
 @pytest.fixture
 def mock_token():
     """Sample JWT token for testing."""
@@ -50,7 +55,7 @@ def sample_ohlcv_data():
 def mock_websocket():
     """Mock WebSocket connection."""
     ws = MagicMock()
-    ws.recv.return_value = '~m~50~m~{"m":"series_completed","p":["session"]}'
+    ws.recv.return_value = '~m~40~m~{"m":"series_completed","p":["session"]}'
     ws.send.return_value = None
     ws.close.return_value = None
     return ws
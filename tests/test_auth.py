@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import base64
 import json
+import os
 import time
 from unittest.mock import MagicMock, patch
 
@@ -45,16 +46,6 @@ class TestWsEndpoint:
         assert header["Origin"] == "https://www.tradingview.com"
 
 
-class TestCountUniqueBars:
-    def test_counts_distinct_bar_timestamps(self):
-        # Two distinct 10-digit unix timestamps, one repeated.
-        raw = "[1609459200.0,1.0,2.0][1609459260.0,3.0][1609459200.0,1.0,2.0]"
-        assert TvDatafeed._count_unique_bars(raw) == 2
-
-    def test_empty_payload_is_zero(self):
-        assert TvDatafeed._count_unique_bars("") == 0
-
-
 # --------------------------------------------------------------------------- #
 # JWT validation
 # --------------------------------------------------------------------------- #
@@ -106,6 +97,44 @@ class TestCacheAndCookies:
         tv.token_cache_file.write_text("{ not valid json")
         assert tv._load_cache() == {}
 
+    def test_cache_file_read_once_per_process(self, tmp_path):
+        cache = tmp_path / ".tv_token.json"
+        token = make_jwt(int(time.time()) + 10_000)
+        cache.write_text(json.dumps({"token": token, "cookies": {"sessionid": "S"}}))
+        TvDatafeed(token_cache_file=cache)
+
+        with patch("pathlib.Path.read_bytes", side_effect=AssertionError("disk read")):
+            tv = TvDatafeed(token_cache_file=cache)
+        assert tv.token == token
+
+    def test_external_rewrite_is_picked_up(self, tmp_path):
+        cache = tmp_path / ".tv_token.json"
+        cache.write_text(json.dumps({"token": "OLD"}))
+        tv = anon_tv(tmp_path)
+        assert tv._load_cache() == {"token": "OLD"}
+
+        # e.g. token_helper.py saving a new token from another process.
+        cache.write_text(json.dumps({"token": "NEW"}))
+        stat = cache.stat()
+        os.utime(cache, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert tv._load_cache() == {"token": "NEW"}
+
+    def test_cached_payload_is_not_shared(self, tmp_path):
+        cache = tmp_path / ".tv_token.json"
+        cache.write_text(json.dumps({"token": "T", "cookies": {"sessionid": "S"}}))
+        first = TvDatafeed(token_cache_file=cache)
+        first._cookies["sessionid"] = "mutated"
+
+        second = TvDatafeed(token_cache_file=cache)
+        assert second._cookies == {"sessionid": "S"}
+
+    def test_save_updates_cached_payload(self, tmp_path):
+        tv = anon_tv(tmp_path)
+        tv._load_cache()
+        tv._save_token("NEW")
+        with patch("pathlib.Path.read_bytes", side_effect=AssertionError("disk read")):
+            assert tv._load_cache() == {"token": "NEW"}
+
     def test_store_cookies_keeps_only_session_cookies(self, tmp_path):
         tv = anon_tv(tmp_path)
         tv._cookies = {}
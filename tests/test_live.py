@@ -2,23 +2,53 @@
 
 from __future__ import annotations
 
+import threading
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, patch
 
 import pandas as pd
+import pytest
+from websocket import ABNF
 
+from tests.conftest import frame
 from tvDatafeed import Interval, Seis, TvDatafeed, TvDatafeedLive
+from tvDatafeed.main import _frame_head, _SeriesParser
 
 SAT = TvDatafeedLive._SeisesAndTrigger
 
 
+@pytest.fixture(autouse=True)
+def fixed_chart_session():
+    """Pin the chart session id so canned frames (``"p":["cs",...]``) match it."""
+    with patch.object(
+        TvDatafeed, "_TvDatafeed__generate_chart_session", staticmethod(lambda: "cs")
+    ):
+        yield
+
+
+def parsed(raw: str) -> _SeriesParser:
+    """A series parser that has been fed ``raw`` (what _fetch_series returns)."""
+    series = _SeriesParser()
+    if raw:
+        series.feed(raw)
+    return series
+
+
+def sent(ws) -> list[str]:
+    """Decoded payloads passed to ``ws.send`` (messages are sent as bytes)."""
+    return [c.args[0].decode() for c in ws.send.call_args_list]
+
+
 def series_with_completed() -> str:
     """A minimal raw payload that parses to one bar and is 'completed'."""
     return (
-        '{"m":"timescale_update","p":["cs",{"s1":{"s":'
-        '[{"i":0,"v":[1609459200.0,150.0,151.5,149.5,151.0,1000000.0]}],'
-        '"ns":{}}}]}\n'
-        '{"m":"series_completed","p":["cs"]}'
+        frame(
+            '{"m":"timescale_update","p":["cs",{"s1":{"s":'
+            '[{"i":0,"v":[1609459200.0,150.0,151.5,149.5,151.0,1000000.0]}],'
+            '"ns":{}}}]}'
+        )
+        + "\n"
+        + frame('{"m":"series_completed","p":["cs"]}')
     )
 
 
@@ -95,7 +125,7 @@ class TestGetHistAuthRetry:
     def test_refreshes_and_retries_on_auth_error(self, tmp_path):
         tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
         tv.token = "STALE"
-        outcomes = [("", True), (series_with_completed(), False)]
+        outcomes = [(parsed(""), True), (parsed(series_with_completed()), False)]
 
         with (
             patch.object(tv, "_fetch_series", side_effect=outcomes) as fetch,
@@ -113,7 +143,7 @@ class TestGetHistAuthRetry:
         tv.token = "STALE"
 
         with (
-            patch.object(tv, "_fetch_series", return_value=("", True)) as fetch,
+            patch.object(tv, "_fetch_series", return_value=(parsed(""), True)) as fetch,
             patch.object(tv, "_try_refresh_token", return_value=False),
         ):
             df = tv.get_hist("AAPL", "NASDAQ")
@@ -131,7 +161,9 @@ class TestAsyncAuthRetry:
     async def test_async_refreshes_and_retries(self, tmp_path):
         tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
         tv.token = "STALE"
-        fetch = AsyncMock(side_effect=[("", True), (series_with_completed(), False)])
+        fetch = AsyncMock(
+            side_effect=[(parsed(""), True), (parsed(series_with_completed()), False)]
+        )
 
         with (
             patch.object(tv, "_async_fetch_series", fetch),
@@ -165,11 +197,11 @@ class TestQuoteAddSymbolsFlag:
         self, mock_create_connection, mock_websocket, tmp_path
     ):
         tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
+        tv.include_quote_fields = True
         mock_websocket.recv.return_value = series_with_completed()
         tv.get_hist("AAPL", "NASDAQ", n_bars=5)
 
-        sent = [c.args[0] for c in mock_websocket.send.call_args_list]
-        quote_add = [m for m in sent if "quote_add_symbols" in m]
+        quote_add = [m for m in sent(mock_websocket) if "quote_add_symbols" in m]
         assert quote_add, "expected a quote_add_symbols message to be sent"
         assert all("force_permission" not in m for m in quote_add), (
             "quote_add_symbols must not carry the force_permission flag — "
@@ -189,5 +221,342 @@ class TestGetHistNoData:
         # An invalid/empty symbol completes the series with no "s":[...] block.
         # get_hist must return None, not raise AttributeError.
         tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
-        mock_websocket.recv.return_value = '{"m":"series_completed","p":["cs"]}'
+        mock_websocket.recv.return_value = frame('{"m":"series_completed","p":["cs"]}')
         assert tv.get_hist("BADSYM", "NASDAQ", n_bars=5) is None
+
+
+# --------------------------------------------------------------------------- #
+# _fetch_series decodes every received message as it arrives
+# --------------------------------------------------------------------------- #
+
+
+class TestFetchSeriesStreaming:
+    def test_bars_from_every_recv_are_kept(self, mock_create_connection, mock_websocket, tmp_path):
+        tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
+        page = frame(
+            '{"m":"timescale_update","p":["cs",{"s1":{"s":'
+            '[{"i":0,"v":[1609372800.0,1.0,2.0,0.5,1.5,10.0]}],"ns":{}}}]}'
+        )
+        mock_websocket.recv.side_effect = [page, series_with_completed()]
+        series, auth_error = tv._fetch_series("NASDAQ:AAPL", "1D", 2, False)
+
+        assert auth_error is False
+        assert series.completed
+        assert series.received == 2
+        assert [row[0] for row in series.rows()] == [1609372800, 1609459200]
+
+    def test_parser_tracks_completion_per_frame(self):
+        series = _SeriesParser()
+        series.feed(frame('{"m":"series_loading","p":["cs","s1"]}'))
+        assert not series.completed
+        series.feed(series_with_completed())
+        assert series.completed
+        assert series.bar_count == 1
+
+    def test_frame_head_falls_back_to_decoding(self):
+        # Name and session are normally sliced from the '{"m":"' prefix; other
+        # layouts are decoded, and non-JSON frames have neither.
+        assert _frame_head('{"m":"qsd","p":["qs_1",{}]}') == ("qsd", "qs_1")
+        assert _frame_head('{"m":"qsd","p":[]}') == ("qsd", None)
+        assert _frame_head('{ "m": "series_completed", "p": ["cs"] }') == ("series_completed", "cs")
+        assert _frame_head("~h~3") == (None, None)
+        assert _frame_head("{not json") == (None, None)
+
+    def test_frames_for_other_chart_sessions_are_ignored(self):
+        series = _SeriesParser("cs_new")
+        late = frame(
+            '{"m":"timescale_update","p":["cs_old",{"s1":{"s":'
+            '[{"i":0,"v":[1609372800.0,999.0,999.0,999.0,999.0,1.0]}],"ns":{}}}]}'
+        ) + frame('{"m":"series_completed","p":["cs_old","s1"]}')
+        assert series.feed(late) is False
+        assert series.feed(frame('{"m":"critical_error","p":["cs_old","x"]}')) is False
+        assert not series.completed
+        assert series.error is None
+        assert series.bar_count == 0
+
+    def test_control_frames_matched_by_name_not_substring(self):
+        # A symbol description quoting a control name is not a control frame.
+        series = _SeriesParser()
+        page_completed = series.feed(
+            frame('{"m":"qsd","p":["qs",{"n":"X","v":{"description":"series_completed"}}]}')
+        )
+        assert page_completed is False
+        assert not series.completed
+        assert series.error is None
+
+        page_completed = series.feed(
+            frame('{"m":"critical_error","p":["cs","invalid_parameters"]}')
+        )
+        assert page_completed is False
+        assert series.error == "critical_error"
+
+
+# --------------------------------------------------------------------------- #
+# Setup messages are batched into a single WebSocket send
+# --------------------------------------------------------------------------- #
+
+
+class TestSetupBatching:
+    def test_setup_sequence_is_one_send(self, mock_create_connection, mock_websocket, tmp_path):
+        tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
+        mock_websocket.recv.return_value = series_with_completed()
+        tv.get_hist("AAPL", "NASDAQ", n_bars=1)
+
+        # First send is the whole setup sequence; the only other one is the
+        # session cleanup that keeps the persistent connection reusable.
+        assert mock_websocket.send.call_count == 2
+        # Bytes go out as text frames without a str round-trip.
+        setup_call = mock_websocket.send.call_args_list[0]
+        assert isinstance(setup_call.args[0], bytes)
+        assert setup_call.kwargs["opcode"] == ABNF.OPCODE_TEXT
+        payload = sent(mock_websocket)[0]
+        funcs = [
+            "set_auth_token",
+            "chart_create_session",
+            "resolve_symbol",
+            "create_series",
+            "switch_timezone",
+        ]
+        positions = [payload.index(f'"m":"{func}"') for func in funcs]
+        assert positions == sorted(positions)
+        assert payload.count("~m~") == 2 * 5
+        # Quote messages are opt-in; without them there is no quote session
+        # to delete either.
+        assert "quote_" not in payload
+        assert "quote_" not in sent(mock_websocket)[1]
+
+    def test_quote_session_opt_in(self, mock_create_connection, mock_websocket, tmp_path):
+        tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
+        tv.include_quote_fields = True
+        mock_websocket.recv.return_value = series_with_completed()
+        tv.get_hist("AAPL", "NASDAQ", n_bars=1)
+
+        payload = sent(mock_websocket)[0]
+        assert payload.count("~m~") == 2 * 9
+        assert '"m":"quote_set_fields"' in payload
+        assert '"m":"quote_delete_session"' in sent(mock_websocket)[1]
+
+
+# --------------------------------------------------------------------------- #
+# Persistent WebSocket reused across get_hist calls
+# --------------------------------------------------------------------------- #
+
+
+class TestPersistentConnection:
+    def test_second_fetch_reuses_connection_without_reauth(
+        self, mock_create_connection, mock_websocket, tmp_path
+    ):
+        tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
+        mock_websocket.recv.return_value = series_with_completed()
+        assert tv.get_hist("AAPL", "NASDAQ", n_bars=1) is not None
+        mock_websocket.send.reset_mock()
+        assert tv.get_hist("MSFT", "NASDAQ", n_bars=1) is not None
+
+        assert mock_create_connection.call_count == 1
+        setup = sent(mock_websocket)[0]
+        assert "set_auth_token" not in setup
+        assert "NASDAQ:MSFT" in setup
+
+    def test_stale_connection_is_replaced(self, mock_create_connection, mock_websocket, tmp_path):
+        tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
+        mock_websocket.recv.return_value = series_with_completed()
+        tv.get_hist("AAPL", "NASDAQ", n_bars=1)
+
+        # The server dropped the idle connection: the first recv on it fails.
+        mock_websocket.recv.side_effect = [ConnectionError("closed"), series_with_completed()]
+        df = tv.get_hist("MSFT", "NASDAQ", n_bars=1)
+
+        assert df is not None
+        assert mock_create_connection.call_count == 2
+
+    def test_close_frame_on_reused_connection_reconnects(
+        self, mock_create_connection, mock_websocket, tmp_path
+    ):
+        tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
+        mock_websocket.recv.return_value = series_with_completed()
+        tv.get_hist("AAPL", "NASDAQ", n_bars=1)
+
+        # websocket-client's recv() returns "" for the server's close frame.
+        mock_websocket.recv.side_effect = ["", series_with_completed()]
+        assert tv.get_hist("MSFT", "NASDAQ", n_bars=1) is not None
+        assert mock_create_connection.call_count == 2
+
+    def test_buffered_heartbeat_then_failure_reconnects(
+        self, mock_create_connection, mock_websocket, tmp_path
+    ):
+        tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
+        mock_websocket.recv.return_value = series_with_completed()
+        tv.get_hist("AAPL", "NASDAQ", n_bars=1)
+
+        # A heartbeat buffered while idle arrives before the dead socket fails;
+        # it is not a frame for this fetch, so the reuse still counts as stale.
+        mock_websocket.recv.side_effect = [
+            frame("~h~7"),
+            ConnectionError("closed"),
+            series_with_completed(),
+        ]
+        assert tv.get_hist("MSFT", "NASDAQ", n_bars=1) is not None
+        assert mock_create_connection.call_count == 2
+
+    def test_heartbeats_are_echoed(self, mock_create_connection, mock_websocket, tmp_path):
+        tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
+        mock_websocket.recv.side_effect = [frame("~h~3"), series_with_completed()]
+        tv.get_hist("AAPL", "NASDAQ", n_bars=1)
+
+        assert "~m~4~m~~h~3" in sent(mock_websocket)
+
+    def test_failed_fetch_does_not_leak_into_next_symbol(
+        self, mock_create_connection, mock_websocket, tmp_path
+    ):
+        # AAPL times out mid-load; its late bars must not come back as MSFT's.
+        tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
+        sessions = iter(["cs_aapl", "cs_msft"])
+        late_aapl = frame(
+            '{"m":"timescale_update","p":["cs_aapl",{"s1":{"s":'
+            '[{"i":0,"v":[1609372800.0,999.0,999.0,999.0,999.0,1.0]}],"ns":{}}}]}'
+        ) + frame('{"m":"series_completed","p":["cs_aapl","s1"]}')
+        msft = frame(
+            '{"m":"timescale_update","p":["cs_msft",{"s1":{"s":'
+            '[{"i":0,"v":[1609459200.0,1.0,2.0,0.5,1.5,10.0]}],"ns":{}}}]}'
+        ) + frame('{"m":"series_completed","p":["cs_msft","s1"]}')
+        mock_websocket.recv.side_effect = [
+            frame('{"m":"series_loading","p":["cs_aapl","s1"]}'),
+            TimeoutError("timed out"),
+            late_aapl,
+            msft,
+        ]
+        with patch.object(
+            TvDatafeed, "_TvDatafeed__generate_chart_session", staticmethod(lambda: next(sessions))
+        ):
+            assert tv.get_hist("AAPL", "NASDAQ", n_bars=1) is None
+            df = tv.get_hist("MSFT", "NASDAQ", n_bars=1)
+
+        # The timed-out connection was dropped rather than reused.
+        assert mock_create_connection.call_count == 2
+        assert df is not None
+        assert df["open"].tolist() == [1.0]
+
+    def test_token_change_opens_new_connection(
+        self, mock_create_connection, mock_websocket, tmp_path
+    ):
+        tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
+        mock_websocket.recv.return_value = series_with_completed()
+        tv.get_hist("AAPL", "NASDAQ", n_bars=1)
+        tv.token = "REFRESHED"
+        tv.get_hist("AAPL", "NASDAQ", n_bars=1)
+
+        assert mock_create_connection.call_count == 2
+
+    def test_skips_pure_python_utf8_validation(self, mock_create_connection, tmp_path):
+        tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
+        with tv._websocket_connection(None):
+            pass
+        assert mock_create_connection.call_args.kwargs["skip_utf8_validation"] is True
+
+    def test_close_drops_connection(self, mock_create_connection, mock_websocket, tmp_path):
+        tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
+        mock_websocket.recv.return_value = series_with_completed()
+        tv.get_hist("AAPL", "NASDAQ", n_bars=1)
+        tv.close()
+
+        mock_websocket.close.assert_called_once()
+        tv.get_hist("AAPL", "NASDAQ", n_bars=1)
+        assert mock_create_connection.call_count == 2
+
+    def test_close_releases_http_session(self, tmp_path):
+        tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
+        with patch.object(tv._http, "close") as http_close:
+            tv.close()
+        http_close.assert_called_once()
+
+
+# --------------------------------------------------------------------------- #
+# get_hist_batch
+# --------------------------------------------------------------------------- #
+
+
+class TestGetHistBatch:
+    def test_results_follow_query_order(self, tmp_path):
+        tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
+        queries = [
+            {"symbol": "AAPL", "exchange": "NASDAQ", "n_bars": 5},
+            {"symbol": "CRUDEOIL", "exchange": "MCX", "fut_contract": 1},
+            # Same symbol, different interval: both results are kept.
+            {"symbol": "AAPL", "exchange": "NASDAQ", "interval": Interval.in_1_hour},
+        ]
+        with patch.object(
+            TvDatafeed, "get_hist", autospec=True, side_effect=lambda self, **q: dict(q)
+        ) as get_hist:
+            result = tv.get_hist_batch(queries, max_workers=2)
+
+        assert result == queries
+        assert get_hist.call_count == 3
+
+    def test_live_feed_lock_is_not_taken(self, tmp_path):
+        # TvDatafeedLive.get_hist serialises on the live lock; the batch must
+        # call the base implementation so its workers run concurrently.
+        tvl = TvDatafeedLive(token_cache_file=tmp_path / ".tv_token.json")
+        with patch.object(TvDatafeed, "get_hist", autospec=True, return_value="df") as get_hist:
+            with tvl._lock:
+                assert tvl.get_hist_batch([{"symbol": "AAPL"}], max_workers=1) == ["df"]
+        assert get_hist.call_count == 1
+
+    def test_concurrent_fetches_each_get_a_connection(
+        self, mock_create_connection, mock_websocket, tmp_path
+    ):
+        tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
+        mock_websocket.recv.return_value = series_with_completed()
+        result = tv.get_hist_batch(
+            [{"symbol": s, "exchange": "NASDAQ", "n_bars": 1} for s in ("AAPL", "MSFT", "TSLA")]
+        )
+
+        assert len(result) == 3
+        assert all(df is not None and len(df) == 1 for df in result)
+
+    def test_handshakes_run_in_parallel(self, mock_websocket, tmp_path):
+        # Each connect waits until both are in progress; serialised handshakes
+        # would break the barrier and fail the fetches.
+        tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
+        mock_websocket.recv.return_value = series_with_completed()
+        barrier = threading.Barrier(2, timeout=2)
+
+        def connect(*args, **kwargs):
+            barrier.wait()
+            return mock_websocket
+
+        with patch("tvDatafeed.main.create_connection", side_effect=connect):
+            result = tv.get_hist_batch(
+                [{"symbol": s, "exchange": "NASDAQ", "n_bars": 1} for s in ("AAPL", "MSFT")],
+                max_workers=2,
+            )
+
+        assert all(df is not None for df in result)
+
+    def test_empty_batch(self, tmp_path):
+        tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
+        assert tv.get_hist_batch([]) == []
+
+
+# --------------------------------------------------------------------------- #
+# set_auth_token frame is built once per token
+# --------------------------------------------------------------------------- #
+
+
+class TestAuthMessageCache:
+    def test_reused_until_token_changes(self, tmp_path):
+        tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
+        create = tv._TvDatafeed__create_message
+
+        first = create("set_auth_token", ["TOK"])
+        assert first == b'~m~34~m~{"m":"set_auth_token","p":["TOK"]}'
+        assert create("set_auth_token", ["TOK"]) is first
+        assert create("set_auth_token", ["NEW"]) != first
+
+    def test_header_length_matches_ascii_body(self, tmp_path):
+        # Non-ASCII params are escaped, so the header's length (characters on
+        # the server side) equals the byte length of the body.
+        tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
+        message = tv._TvDatafeed__create_message("resolve_symbol", ["cs", "BIST:ÇEKİM"])
+        header, _, body = message.partition(b"~m~")[2].partition(b"~m~")
+        assert message.isascii()
+        assert int(header) == len(body)
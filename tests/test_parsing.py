@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import json
-from unittest.mock import Mock, patch
+import re
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 
 import pandas as pd
 import pytest
+import requests
 
+from tests.conftest import frame
 from tvDatafeed import Interval, TvDatafeed
 
 # Name-mangled private staticmethods exposed for unit testing.
@@ -19,7 +23,7 @@ create_df = TvDatafeed._TvDatafeed__create_df
 def series_msg(rows: list[str]) -> str:
     """Build a TradingView-style series payload from raw value lists."""
     bars = ",".join(f'{{"i":{i},"v":[{r}]}}' for i, r in enumerate(rows))
-    return f'~m~100~m~{{"m":"timescale_update","p":["cs",{{"s1":{{"s":[{bars}],"ns":{{}}}}}}]}}'
+    return frame(f'{{"m":"timescale_update","p":["cs",{{"s1":{{"s":[{bars}],"ns":{{}}}}}}]}}')
 
 
 # --------------------------------------------------------------------------- #
@@ -88,11 +92,55 @@ class TestParseData:
         assert len(rows) == 1
         assert rows[0] == [1609459200, 9.0, 9.0, 9.0, 9.0, 999.0]
 
+    def test_parses_frames_sharing_one_recv(self):
+        # A single recv can carry several concatenated frames, including
+        # heartbeats and non-series messages that must be skipped.
+        raw = (
+            frame("~h~1")
+            + frame('{"m":"series_loading","p":["cs","s1"]}')
+            + series_msg(["1609459200,1,2,0.5,1.5,100"])
+            + frame('{"m":"series_completed","p":["cs","s1"]}')
+        )
+        rows = parse_data(raw, False)
+        assert rows == [[1609459200, 1.0, 2.0, 0.5, 1.5, 100.0]]
+
     def test_no_series_block_returns_empty(self):
         # series_completed with no data block (e.g. invalid symbol) must return
         # [] rather than raising AttributeError.
         assert parse_data('{"m":"series_completed","p":["cs"]}', True) == []
 
+    def test_malformed_bars_are_skipped(self):
+        # Unconvertible bars fall back to the per-bar path and are dropped
+        # without losing the well-formed bars around them.
+        raw = series_msg(
+            [
+                "1609459200.0,1.0,2.0,0.5,1.5,100.0",
+                '"bad",1.0,2.0,0.5,1.5,100.0',
+                "1609545600.0,1.1,2.1,0.6,1.6",
+            ]
+        )
+        rows = parse_data(raw, False)
+        assert rows == [
+            [1609459200, 1.0, 2.0, 0.5, 1.5, 100.0],
+            [1609545600, 1.1, 2.1, 0.6, 1.6, 0.0],
+        ]
+
+    def test_non_list_series_block_is_skipped(self):
+        for block in ("null", "5", '{"i":0}'):
+            raw = frame(f'{{"m":"timescale_update","p":["cs",{{"s1":{{"s":{block}}}}}]}}')
+            assert parse_data(raw, False) == []
+
+    def test_null_prices_are_zero(self):
+        rows = parse_data(series_msg(["1609459200,null,2,1,1.5,10"]), False)
+        assert rows == [[1609459200, 0.0, 2.0, 1.0, 1.5, 10.0]]
+
+    def test_null_volume_is_zero(self):
+        # Same as an omitted volume, on both the list and DataFrame paths.
+        rows = parse_data(series_msg(["1609459200.0,1.0,2.0,0.5,1.5,null"]), False)
+        assert rows == [[1609459200, 1.0, 2.0, 0.5, 1.5, 0.0]]
+        df = create_df(rows, "NASDAQ:AAPL")
+        assert df["volume"].iloc[0] == 0.0
+
 
 # --------------------------------------------------------------------------- #
 # __format_symbol
@@ -113,6 +161,16 @@ class TestFormatSymbol:
         with pytest.raises(ValueError):
             format_symbol("X", "NSE", "not-an-int")
 
+    def test_unhashable_contract_raises_value_error(self):
+        with pytest.raises(ValueError):
+            format_symbol("GOLD", "MCX", [1])
+
+    def test_cached_int_contract_does_not_mask_float(self):
+        # The memoization is typed: 1.0 == 1 must not reuse the int result.
+        assert format_symbol("GOLD", "MCX", 1) == "MCX:GOLD1!"
+        with pytest.raises(ValueError):
+            format_symbol("GOLD", "MCX", 1.0)
+
 
 # --------------------------------------------------------------------------- #
 # __create_df
@@ -127,32 +185,112 @@ class TestCreateDf:
         assert list(df.columns) == ["symbol", "open", "high", "low", "close", "volume"]
         assert df.iloc[0]["symbol"] == "NASDAQ:AAPL"
 
+    def test_index_is_utc_datetime(self):
+        rows = [[1609459200, 1.0, 2.0, 0.5, 1.5, 100.0], [1609545600, 1.1, 2.1, 0.6, 1.6, 110.0]]
+        df = create_df(rows, "NASDAQ:AAPL")
+        assert df.index.name == "datetime"
+        assert str(df.index.tz) == "UTC"
+        assert df.index[0] == pd.Timestamp("2021-01-01", tz="UTC")
+        assert df["close"].dtype == "float64"
+
+    def test_null_volume_becomes_zero(self):
+        df = create_df([[1609459200, 1.0, 2.0, 0.5, 1.5, None]], "TVC:SPX")
+        assert df.iloc[0]["volume"] == 0.0
+
     def test_invalid_input_returns_none(self):
         assert create_df("garbage", "SYM") is None
 
 
 # --------------------------------------------------------------------------- #
-# search_symbol (uses module-level requests.get)
+# search_symbol (uses the client's pooled requests.Session)
 # --------------------------------------------------------------------------- #
 
 
+def json_response(payload) -> requests.Response:
+    """A real requests.Response carrying ``payload`` as its JSON body."""
+    resp = requests.Response()
+    resp.status_code = 200
+    resp._content = json.dumps(payload).encode()
+    return resp
+
+
 class TestSearchSymbol:
     def test_strips_html_and_parses(self, tmp_path):
         tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
-        payload = [{"symbol": "<em>AAP</em>L", "exchange": "NASDAQ"}]
-        resp = Mock()
-        resp.raise_for_status.return_value = None
-        resp.text = json.dumps(payload)
-        with patch("tvDatafeed.main.requests.get", return_value=resp):
+        payload = [
+            {"symbol": "<em>AAP</em>L", "description": "<em>Apple</em> Inc", "exchange": "NASDAQ"}
+        ]
+        with patch.object(tv._http, "get", return_value=json_response(payload)):
             results = tv.search_symbol("AAPL", "NASDAQ")
-        assert results == [{"symbol": "AAPL", "exchange": "NASDAQ"}]
+        assert results == [{"symbol": "AAPL", "description": "Apple Inc", "exchange": "NASDAQ"}]
+
+    def test_reuses_one_session(self, tmp_path):
+        tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
+        with patch.object(tv._http, "get", return_value=json_response([])) as get:
+            tv.search_symbol("AAPL")
+            tv.search_symbol("MSFT")
+        assert get.call_count == 2
+
+    def test_invalid_json_returns_empty(self, tmp_path):
+        tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = b"<html>not json</html>"
+        with patch.object(tv._http, "get", return_value=resp):
+            assert tv.search_symbol("AAPL") == []
 
     def test_network_error_returns_empty(self, tmp_path):
-        import requests
+        tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
+        with patch.object(tv._http, "get", side_effect=requests.RequestException):
+            assert tv.search_symbol("AAPL") == []
 
+    def test_repeated_query_is_cached(self, tmp_path):
         tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
-        with patch("tvDatafeed.main.requests.get", side_effect=requests.RequestException):
+        payload = [{"symbol": "AAPL", "exchange": "NASDAQ"}]
+        with patch.object(tv._http, "get", return_value=json_response(payload)) as get:
+            first = tv.search_symbol("AAPL", "NASDAQ")
+            first[0]["symbol"] = "MUTATED"
+            second = tv.search_symbol("AAPL", "NASDAQ")
+            tv.search_symbol("AAPL", "NYSE")
+        assert get.call_count == 2
+        assert second == payload
+
+    def test_nested_values_are_not_shared_with_cache(self, tmp_path):
+        tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
+        payload = [{"symbol": "CL", "contracts": [{"symbol": "CL1!"}]}]
+        with patch.object(tv._http, "get", return_value=json_response(payload)):
+            tv.search_symbol("CL")[0]["contracts"][0]["symbol"] = "MUTATED"
+            assert tv.search_symbol("CL") == payload
+
+    def test_concurrent_stores_keep_cache_bounded(self, tmp_path):
+        tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
+        tv._SEARCH_CACHE_SIZE = 4
+
+        def store(worker):
+            for i in range(200):
+                tv._cache_search_results((f"{worker}-{i}", ""), [])
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(store, range(8)))
+        assert len(tv._search_cache) <= 4
+
+    def test_cache_expires(self, tmp_path):
+        tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
+        with (
+            patch.object(tv._http, "get", return_value=json_response([])) as get,
+            patch("tvDatafeed.main.time.monotonic", side_effect=[0.0, 301.0, 301.0]),
+        ):
+            tv.search_symbol("AAPL")
+            tv.search_symbol("AAPL")
+        assert get.call_count == 2
+
+    def test_errors_are_not_cached(self, tmp_path):
+        tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
+        with patch.object(tv._http, "get", side_effect=requests.RequestException):
             assert tv.search_symbol("AAPL") == []
+        payload = [{"symbol": "AAPL"}]
+        with patch.object(tv._http, "get", return_value=json_response(payload)):
+            assert tv.search_symbol("AAPL") == payload
 
 
 # --------------------------------------------------------------------------- #
@@ -161,6 +299,13 @@ class TestSearchSymbol:
 
 
 class TestMisc:
+    def test_session_ids(self):
+        qs = TvDatafeed._TvDatafeed__generate_session()
+        cs = TvDatafeed._TvDatafeed__generate_chart_session()
+        assert re.fullmatch(r"qs_[0-9a-f]{12}", qs)
+        assert re.fullmatch(r"cs_[0-9a-f]{12}", cs)
+        assert TvDatafeed._TvDatafeed__generate_session() != qs
+
     def test_get_token(self, tmp_path):
         tv = TvDatafeed(token_cache_file=tmp_path / ".tv_token.json")
         tv.token = "TOK"
@@ -623,6 +623,8 @@ class TvDatafeedLive(TvDatafeed):
 
             if self._main_thread is not None:
                 self._main_thread.join(timeout=5)
+
+            self.close()
         except Exception as e:
             logger.debug("Error during cleanup: %s", e)
 
@@ -3,26 +3,55 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 import datetime
 import enum
+import functools
 import json
 import logging
-import random
 import re
-import string
+import secrets
 import threading
+import time
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar
 
+import numpy as np
 import pandas as pd
 import requests
-from websocket import WebSocket, create_connection
+from websocket import ABNF, WebSocket, create_connection
 from websockets import connect
 
+# orjson (optional ``fast`` extra) encodes/decodes several times faster than
+# the stdlib - most of all on the number-heavy series frames. Fall back
+# transparently without it. Both variants of _json_dumps emit compact,
+# ASCII-only JSON as bytes, ready to frame and send without re-encoding (the
+# ~m~<len>~m~ header counts characters, which then equals the byte length).
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: object) -> bytes:
+        data = orjson.dumps(obj)
+        # orjson has no ensure_ascii; non-ASCII input is rare (e.g. a symbol
+        # typed with a unicode character), so escape it via the stdlib.
+        if data.isascii():
+            return data
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: object) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +61,251 @@ logger = logging.getLogger(__name__)
 # where the host is chosen from one token value and set_auth_token sends another.
 _USE_CURRENT_TOKEN = object()
 
+# Compiled once: _AUTH_TOKEN_RE runs on every session refresh.
+_AUTH_TOKEN_RE = re.compile(r'"auth_token":"(eyJ[^"]+)"')
+
+# Frame names that mean the server rejected the request (commonly an expired
+# token), matched against each frame's "m" name.
+_ERROR_MESSAGES = frozenset({"protocol_error", "critical_error"})
+
+
+def _iter_frames(raw: str) -> Iterator[str]:
+    """Yield the bodies of the ``~m~<len>~m~<body>`` frames in a raw payload.
+
+    A single ``recv`` can carry several concatenated frames, and the fetch
+    loops join successive ``recv`` results with newlines, so frames are located
+    by scanning for their headers rather than assuming they are contiguous.
+    """
+    pos = raw.find("~m~")
+    while pos != -1:
+        start = pos + 3
+        end = raw.find("~m~", start)
+        if end == -1:
+            return
+        try:
+            length = int(raw[start:end])
+        except ValueError:
+            # Not a header (stray "~m~"); resume scanning after it.
+            pos = end
+            continue
+        body_start = end + 3
+        yield raw[body_start : body_start + length]
+        pos = raw.find("~m~", body_start + length)
+
+
+def _frame_head(body: str) -> tuple[str | None, str | None]:
+    """Return the ``m`` name and session id (``p[0]``) of a frame body.
+
+    The server always writes ``m`` first (``{"m":"<name>","p":["<session>",
+    ...]}``), so both are sliced straight out of the text; anything else is
+    decoded as a fallback. Heartbeats (``~h~<n>``) and other non-JSON frames
+    have neither. The session is None when ``p[0]`` is not a string.
+    """
+    if body.startswith('{"m":"'):
+        end = body.find('"', 6)
+        if end != -1:
+            name = body[6:end]
+            if body.startswith('","p":["', end):
+                session_end = body.find('"', end + 8)
+                if session_end != -1:
+                    return name, body[end + 8 : session_end]
+            return name, None
+    if not body.startswith("{"):
+        return None, None
+    try:
+        message = _json_loads(body)
+        m, p = message.get("m"), message.get("p")
+    except (ValueError, AttributeError):
+        return None, None
+    session = p[0] if isinstance(p, list) and p and isinstance(p[0], str) else None
+    return (m if isinstance(m, str) else None), session
+
+
+class _SeriesParser:
+    """Incremental decoder for the frames of one series fetch.
+
+    Each received WebSocket message is fed in as it arrives, so only one
+    message is held in memory at a time and decoding overlaps the network
+    wait. Each ``timescale_update`` frame is decoded as JSON in one shot and
+    the ``v`` arrays of its ``p[1].s1.s`` bars are kept as decoded. The paging
+    loop receives one such frame per page, so bars are collected from EVERY
+    frame (not just the first); sorting and deduping by timestamp -
+    request_more_data can resend overlapping bars - happen afterwards in one
+    numpy pass (see ``array``), so no per-bar work is done in Python.
+
+    TradingView never splits a frame across WebSocket messages, so each
+    message is decoded on its own. Control frames (``series_completed``, the
+    error frames) are recognised by their ``m`` name, so the fetch loops never
+    substring-scan the raw message.
+
+    Given a ``chart_session``, frames addressed to any other session are
+    ignored: on a reused connection, late frames of an earlier fetch must not
+    be taken as this fetch's bars. ``matched`` counts the frames that were for
+    this session. Heartbeats are queued for the fetch loop to echo (see
+    ``pop_heartbeats``).
+    """
+
+    def __init__(self, chart_session: str | None = None) -> None:
+        self.chart_session = chart_session
+        self.completed = False
+        self.error: str | None = None
+        self.received = 0
+        self.matched = 0
+        self._heartbeats: list[str] = []
+        self._values: list[list] = []
+        self._array: np.ndarray | None = None
+
+    @property
+    def bar_count(self) -> int:
+        """Number of distinct bars received so far."""
+        return len(self.array())
+
+    def feed(self, raw: str) -> bool:
+        """Decode one received message (one or more frames).
+
+        Args:
+            raw: Raw WebSocket message
+
+        Returns:
+            True if the message carried a ``series_completed`` frame, i.e. a
+            page of the series finished loading
+        """
+        self.received += 1
+        page_completed = False
+
+        chart_session = self.chart_session
+        for body in _iter_frames(raw):
+            if body.startswith("~h~"):
+                self._heartbeats.append(body)
+                continue
+            m, session = _frame_head(body)
+            if m in _ERROR_MESSAGES:
+                # protocol_error carries no session; critical_error names the
+                # chart session it is about.
+                if not (
+                    chart_session
+                    and session
+                    and session.startswith("cs_")
+                    and session != chart_session
+                ):
+                    self.error = m
+                continue
+            if chart_session:
+                if session != chart_session:
+                    continue
+                self.matched += 1
+            if m == "series_completed":
+                self.completed = page_completed = True
+                continue
+            # Only bar frames are decoded; quote data, series_loading etc. are
+            # skipped by name without building their dicts.
+            if m != "timescale_update":
+                continue
+            try:
+                series = _json_loads(body)["p"][1]["s1"]["s"]
+            except (ValueError, KeyError, IndexError, TypeError):
+                continue
+            if not isinstance(series, list):
+                # e.g. "s": null - no bars in this frame.
+                continue
+
+            try:
+                values = [bar["v"] for bar in series]
+            except (KeyError, TypeError):
+                # Malformed bar entries are skipped rather than failing the page.
+                values = [bar["v"] for bar in series if isinstance(bar, dict) and "v" in bar]
+            self._values.extend(values)
+            self._array = None
+
+        return page_completed
+
+    def pop_heartbeats(self) -> list[str]:
+        """Return (and forget) the heartbeat bodies received since the last call.
+
+        TradingView closes connections that don't echo its ``~h~<n>``
+        heartbeats back, so the fetch loops send each one straight back.
+        """
+        beats, self._heartbeats = self._heartbeats, []
+        return beats
+
+    def array(self) -> np.ndarray:
+        """Return the collected bars as a float64 array sorted oldest-first.
+
+        Returns:
+            ``(n, 6)`` array of [epoch, open, high, low, close, volume] rows,
+            one per distinct epoch (the last one received wins). Null values
+            and an omitted volume are 0.0.
+        """
+        if self._array is None:
+            self._array = self._assemble(self._values)
+        return self._array
+
+    @staticmethod
+    def _assemble(values: list[list]) -> np.ndarray:
+        """Convert decoded ``v`` arrays into a sorted, deduplicated array."""
+        if not values:
+            return np.empty((0, 6), dtype=np.float64)
+
+        try:
+            arr = np.array(values, dtype=np.float64)
+            if arr.ndim != 2 or arr.shape[1] < 5:
+                raise ValueError("unexpected bar shape")
+        except (TypeError, ValueError):
+            arr = _SeriesParser._assemble_ragged(values)
+        else:
+            if arr.shape[1] == 5:
+                # Volume is omitted for some instruments (e.g. indices).
+                logger.debug("No volume data available")
+                arr = np.column_stack((arr, np.zeros(len(arr))))
+            arr = arr[:, :6]
+
+        arr = arr[~np.isnan(arr[:, 0])]
+        # Null values (e.g. an instrument without volume data) read as NaN;
+        # report them as 0.0, like an omitted volume.
+        fields = arr[:, 1:]
+        fields[np.isnan(fields)] = 0.0
+        # Later frames carry newer values for a repeated timestamp: take the
+        # first occurrence in the reversed array. np.unique also sorts.
+        _, first = np.unique(arr[::-1, 0], return_index=True)
+        return arr[len(arr) - 1 - first]
+
+    @staticmethod
+    def _assemble_ragged(values: list[list]) -> np.ndarray:
+        """Slow path for a mix of bar lengths or unconvertible bars."""
+        rows = []
+        for v in values:
+            try:
+                row = np.array(v[:6], dtype=np.float64)
+            except (TypeError, ValueError):
+                continue
+            if row.ndim != 1 or len(row) < 5:
+                continue
+            # Pad per bar so one bar without volume doesn't affect the others.
+            if len(row) == 5:
+                logger.debug("No volume data available")
+                row = np.append(row, 0.0)
+            rows.append(row)
+        if not rows:
+            return np.empty((0, 6), dtype=np.float64)
+        return np.vstack(rows)
+
+    def rows(self, is_return_dataframe: bool = False) -> list[list]:
+        """Return the collected bars sorted oldest-first.
+
+        Args:
+            is_return_dataframe: Whether to convert epochs to datetimes.
+                ``__create_df`` takes numeric epochs and converts them itself.
+
+        Returns:
+            List of [timestamp, open, high, low, close, volume] rows. Empty if
+            no series data was received.
+        """
+        rows = self.array().tolist()
+        if is_return_dataframe:
+            utc = datetime.timezone.utc
+            return [[datetime.datetime.fromtimestamp(row[0], tz=utc), *row[1:]] for row in rows]
+        return [[int(row[0]), *row[1:]] for row in rows]
+
 
 class Interval(enum.Enum):
     """Supported time intervals for market data."""
@@ -87,14 +361,26 @@ class TvDatafeed:
     __max_more_requests: ClassVar[int] = 20
     __ws_timeout: ClassVar[int] = 30
 
+    # (mtime_ns, contents) of token cache files by path, shared by all clients
+    # in the process (see _load_cache). Only successful reads/writes are stored.
+    _TOKEN_CACHE: ClassVar[dict[Path, tuple[int, dict]]] = {}
+
+    # Search result fields TradingView wraps matches in <em>...</em> for.
+    _SEARCH_HIGHLIGHT_FIELDS: ClassVar[tuple[str, ...]] = ("symbol", "description")
+
+    # search_symbol results are reused for this long (seconds), for at most
+    # this many distinct (text, exchange) queries per client.
+    _SEARCH_CACHE_TTL: ClassVar[float] = 300.0
+    _SEARCH_CACHE_SIZE: ClassVar[int] = 256
+
     # Durable login cookies that can be exchanged for fresh auth tokens.
     # `sessionid` (with "remember me") is long-lived, just like the browser
     # session, so we persist it and re-mint short-lived auth_tokens from it
     # instead of logging in (and risking CAPTCHA) every time the JWT expires.
     _SESSION_COOKIES: ClassVar[tuple[str, ...]] = ("sessionid", "sessionid_sign")
 
-    # Quote fields requested for every series fetch. Defined once so the sync
-    # and async fetch paths cannot drift apart.
+    # Quote fields requested when include_quote_fields is set. Defined once so
+    # the sync and async fetch paths cannot drift apart.
     _QUOTE_FIELDS: ClassVar[tuple[str, ...]] = (
         "ch",
         "chp",
@@ -129,11 +415,29 @@ class TvDatafeed:
     ) -> None:
         """Initialize TradingView data feed client."""
         self.ws_debug: bool = False
+        # The quote session (and its field list) is not needed for historical
+        # bars; set this to open one alongside every fetch's chart session.
+        self.include_quote_fields: bool = False
         self.token_cache_file = Path(token_cache_file).expanduser()
         self._lock = threading.Lock()
-        self._ws_lock = threading.Lock()
+
+        # Persistent WebSocket reused across get_hist calls, with the token it
+        # authenticated with. _persistent_lock is held for a whole fetch.
+        self._ws: WebSocket | None = None
+        self._ws_token: str | None = None
+        self._persistent_lock = threading.Lock()
+        # (token, framed set_auth_token message) - see __auth_message.
+        self._auth_message: tuple[str, bytes] | None = None
         self._token_lock = threading.Lock()
 
+        # Pooled HTTP session for symbol search, so repeated searches reuse
+        # one TCP+TLS connection instead of handshaking per call.
+        self._http = requests.Session()
+        self._http.headers.update(self.__signin_headers)
+        # (text, exchange) -> (monotonic time fetched, results) - see search_symbol.
+        self._search_cache: dict[tuple[str, str], tuple[float, list[dict]]] = {}
+        self._search_lock = threading.Lock()
+
         # Durable login cookies and credentials, used to refresh the
         # short-lived auth_token without a full (CAPTCHA-prone) re-login.
         self._cookies: dict[str, str] = {}
@@ -174,18 +478,42 @@ class TvDatafeed:
         validating the token - an expired token is fine here because the
         cached session cookies can still be used to refresh it.
 
+        A successful read is memoized per file in ``_TOKEN_CACHE`` (kept in
+        sync by ``_save_token``), so constructing many clients in one process
+        costs a single ``stat`` each instead of open + read + JSON parse. The
+        file's mtime is checked so an external rewrite (e.g. by
+        ``token_helper.py``) is still picked up.
+
         Returns:
             Cache dict (possibly empty)
         """
-        if not self.token_cache_file.exists():
+        try:
+            mtime = self.token_cache_file.stat().st_mtime_ns
+        except OSError:
             return {}
 
+        cached = self._TOKEN_CACHE.get(self.token_cache_file)
+        if cached is not None and cached[0] == mtime:
+            return self._copy_cache(cached[1])
+
         try:
-            data = json.loads(self.token_cache_file.read_text())
-            return data if isinstance(data, dict) else {}
+            data = _json_loads(self.token_cache_file.read_bytes())
         except Exception as e:
             logger.debug("Failed to load token cache: %s", e)
             return {}
+        if not isinstance(data, dict):
+            return {}
+
+        self._TOKEN_CACHE[self.token_cache_file] = (mtime, self._copy_cache(data))
+        return data
+
+    @staticmethod
+    def _copy_cache(data: dict) -> dict:
+        """Copy a cache payload so callers can't mutate the memoized one."""
+        copied = dict(data)
+        if isinstance(copied.get("cookies"), dict):
+            copied["cookies"] = dict(copied["cookies"])
+        return copied
 
     def _is_token_valid(self, token: str) -> bool:
         """Validate authentication token by checking JWT expiration.
@@ -214,7 +542,7 @@ class TvDatafeed:
 
             # Decode and parse payload
             decoded = base64.urlsafe_b64decode(payload)
-            data = json.loads(decoded)
+            data = _json_loads(decoded)
 
             # Check expiration
             exp = data.get("exp")
@@ -247,8 +575,14 @@ class TvDatafeed:
             payload: dict = {"token": token}
             if self._cookies:
                 payload["cookies"] = self._cookies
-            self.token_cache_file.write_text(json.dumps(payload))
+            self.token_cache_file.write_bytes(_json_dumps(payload))
+            self._TOKEN_CACHE[self.token_cache_file] = (
+                self.token_cache_file.stat().st_mtime_ns,
+                self._copy_cache(payload),
+            )
         except Exception as e:
+            # The file may or may not have been written; re-read it next time.
+            self._TOKEN_CACHE.pop(self.token_cache_file, None)
             logger.warning("Failed to save token: %s", e)
 
     def _store_cookies(self, cookie_jar) -> None:
@@ -294,7 +628,7 @@ class TvDatafeed:
                 timeout=10,
             )
             response.raise_for_status()
-            match = re.search(r'"auth_token":"(eyJ[^"]+)"', response.text)
+            match = _AUTH_TOKEN_RE.search(response.text)
             token = match.group(1) if match else None
         except requests.RequestException as e:
             logger.warning("Failed to refresh token from session: %s", e)
@@ -656,14 +990,7 @@ class TvDatafeed:
         """
         ws = None
         try:
-            with self._ws_lock:
-                logger.debug("Creating WebSocket connection")
-                url, header = self._ws_endpoint(token)
-                ws = create_connection(
-                    url,
-                    header=header,
-                    timeout=self.__ws_timeout,
-                )
+            ws = self._open_websocket(token)
             yield ws
         finally:
             if ws:
@@ -672,6 +999,88 @@ class TvDatafeed:
                 except Exception as e:
                     logger.debug("Error closing WebSocket: %s", e)
 
+    def _open_websocket(self, token: object = _USE_CURRENT_TOKEN) -> WebSocket:
+        """Open a WebSocket to the data host matching ``token``.
+
+        Not serialised: each call builds its own connection, so concurrent
+        fetches (e.g. ``get_hist_batch``) handshake in parallel.
+        """
+        logger.debug("Creating WebSocket connection")
+        url, header = self._ws_endpoint(token)
+        return create_connection(
+            url,
+            header=header,
+            timeout=self.__ws_timeout,
+            # Without the optional wsaccel extension, websocket-client
+            # validates every text frame with a per-byte pure-Python UTF-8
+            # DFA (~0.3 s per MB of series data). recv() decodes the frame
+            # as UTF-8 anyway, which rejects invalid data on its own.
+            skip_utf8_validation=True,
+        )
+
+    @contextmanager
+    def _series_connection(
+        self, token: str | None, fresh: bool = False
+    ) -> Generator[tuple[WebSocket, bool], None, None]:
+        """Yield a connection for one series fetch, reusing the persistent one.
+
+        The persistent connection stays open across ``get_hist`` calls, so the
+        TLS handshake and ``set_auth_token`` are paid once rather than per
+        symbol. It serves one fetch at a time; a concurrent caller gets a
+        one-shot connection instead of waiting for it.
+
+        Args:
+            token: Token captured for this fetch. The persistent connection is
+                only reused if it was authenticated with the same token.
+            fresh: Replace the persistent connection even if it looks usable
+
+        Yields:
+            Tuple of (ws, authenticated). ``authenticated`` is True when the
+            connection already sent ``set_auth_token`` for ``token``.
+        """
+        if not self._persistent_lock.acquire(blocking=False):
+            with self._websocket_connection(token) as ws:
+                yield ws, False
+            return
+
+        try:
+            current = self._ws
+            if not fresh and current is not None and current.connected and self._ws_token == token:
+                ws, authenticated = current, True
+            else:
+                self._discard_connection(current)
+                ws, authenticated = self._open_websocket(token), False
+                self._ws, self._ws_token = ws, token
+            try:
+                yield ws, authenticated
+            except BaseException:
+                # The protocol state is unknown after a failure mid-fetch.
+                self._discard_connection(ws)
+                raise
+        finally:
+            self._persistent_lock.release()
+
+    def _discard_connection(self, ws: WebSocket | None) -> None:
+        """Close ``ws`` and forget it if it is the persistent connection."""
+        if ws is None:
+            return
+        if ws is self._ws:
+            self._ws, self._ws_token = None, None
+        try:
+            ws.close()
+        except Exception as e:
+            logger.debug("Error closing WebSocket: %s", e)
+
+    def close(self) -> None:
+        """Close the persistent WebSocket and the pooled HTTP connections.
+
+        The next fetch or search transparently opens (and authenticates) new
+        ones.
+        """
+        with self._persistent_lock:
+            self._discard_connection(self._ws)
+        self._http.close()
+
     def _ws_endpoint(self, token: object = _USE_CURRENT_TOKEN) -> tuple[str, dict]:
         """Pick the WebSocket data host based on auth status.
 
@@ -696,82 +1105,84 @@ class TvDatafeed:
     def _series_setup_messages(
         self,
         token: str | None,
-        session: str,
+        session: str | None,
         chart_session: str,
         symbol: str,
         interval_value: str,
         n_bars: int,
         extended_session: bool,
+        authenticate: bool = True,
     ) -> list[tuple[str, list]]:
         """Build the ordered (func, params) WebSocket setup messages.
 
         Shared by the sync and async fetch paths so the protocol sequence and
-        the quote-field list cannot drift between them.
+        the quote-field list cannot drift between them. Both paths send the
+        whole sequence as one batched frame (see ``__create_batch``).
+
+        ``authenticate=False`` omits ``set_auth_token`` for a reused
+        connection that already sent it. ``session=None`` omits the quote
+        session messages - only the chart session produces the OHLCV bars.
         """
         auth_token = token if token else "unauthorized_user_token"
         session_type = "extended" if extended_session else "regular"
         symbol_config = f'={{"symbol":"{symbol}","adjustment":"splits","session":"{session_type}"}}'
+        auth = [("set_auth_token", [auth_token])] if authenticate else []
+        quote = (
+            [
+                ("quote_create_session", [session]),
+                ("quote_set_fields", [session, *self._QUOTE_FIELDS]),
+                ("quote_add_symbols", [session, symbol]),
+                ("quote_fast_symbols", [session, symbol]),
+            ]
+            if session
+            else []
+        )
         return [
-            ("set_auth_token", [auth_token]),
+            *auth,
             ("chart_create_session", [chart_session, ""]),
-            ("quote_create_session", [session]),
-            ("quote_set_fields", [session, *self._QUOTE_FIELDS]),
-            ("quote_add_symbols", [session, symbol]),
-            ("quote_fast_symbols", [session, symbol]),
+            *quote,
             ("resolve_symbol", [chart_session, "symbol_1", symbol_config]),
             ("create_series", [chart_session, "s1", "s1", "symbol_1", interval_value, n_bars]),
             ("switch_timezone", [chart_session, "exchange"]),
         ]
 
-    @staticmethod
-    def _bar_timestamps(raw: str) -> set[str]:
-        """Extract unique bar-timestamp strings from a raw series payload.
-
-        Used to count bars across paged frames without re-parsing them.
-        """
-        return set(re.findall(r"\[(\d{9,10})\.", raw))
-
-    @staticmethod
-    def _count_unique_bars(raw: str) -> int:
-        """Count unique bar timestamps in a raw TradingView series payload."""
-        return len(TvDatafeed._bar_timestamps(raw))
-
     @staticmethod
     def __generate_session() -> str:
         """Generate random session ID for quote session.
 
         Returns:
-            Session ID string (format: qs_<random>)
+            Session ID string (format: qs_<12 hex chars>)
         """
-        random_string = "".join(random.choice(string.ascii_lowercase) for _ in range(12))
-        return f"qs_{random_string}"
+        return "qs_" + secrets.token_hex(6)
 
     @staticmethod
     def __generate_chart_session() -> str:
         """Generate random session ID for chart session.
 
         Returns:
-            Chart session ID string (format: cs_<random>)
+            Chart session ID string (format: cs_<12 hex chars>)
         """
-        random_string = "".join(random.choice(string.ascii_lowercase) for _ in range(12))
-        return f"cs_{random_string}"
+        return "cs_" + secrets.token_hex(6)
 
     @staticmethod
-    def __prepend_header(st: str) -> str:
+    def __prepend_header(st: bytes) -> bytes:
         """Prepend TradingView protocol header to message.
 
         Args:
-            st: Message string
+            st: Encoded (ASCII) message
 
         Returns:
             Message with protocol header
         """
-        return f"~m~{len(st)}~m~{st}"
+        return b"~m~%d~m~%s" % (len(st), st)
 
     @staticmethod
-    def __construct_message(func: str, param_list: list) -> str:
+    def __construct_message(func: str, param_list: list) -> bytes:
         """Construct JSON message for WebSocket.
 
+        Messages stay bytes through framing and batching and are sent as text
+        frames as-is, so they are never re-encoded to UTF-8 on the way out.
+
         Args:
             func: Function name
             param_list: List of parameters
@@ -779,9 +1190,9 @@ class TvDatafeed:
         Returns:
             JSON-encoded message
         """
-        return json.dumps({"m": func, "p": param_list}, separators=(",", ":"))
+        return _json_dumps({"m": func, "p": param_list})
 
-    def __create_message(self, func: str, param_list: list) -> str:
+    def __create_message(self, func: str, param_list: list) -> bytes:
         """Create complete WebSocket message with header.
 
         Args:
@@ -791,8 +1202,32 @@ class TvDatafeed:
         Returns:
             Complete message ready to send
         """
+        if func == "set_auth_token":
+            return self.__auth_message(param_list[0])
         return self.__prepend_header(self.__construct_message(func, param_list))
 
+    def __auth_message(self, auth_token: str) -> bytes:
+        """Return the framed ``set_auth_token`` message, built once per token.
+
+        It is the only setup message that is identical across fetches (the
+        others embed per-fetch session ids), and it is also the largest; each
+        new connection - e.g. the one-shot ones in ``get_hist_batch`` - sends
+        it again.
+
+        Args:
+            auth_token: Token (or the anonymous placeholder) to send
+
+        Returns:
+            Complete message ready to send
+        """
+        cached = self._auth_message
+        if cached is None or cached[0] != auth_token:
+            message = self.__prepend_header(
+                self.__construct_message("set_auth_token", [auth_token])
+            )
+            cached = self._auth_message = (auth_token, message)
+        return cached[1]
+
     def __send_message(self, ws: WebSocket, func: str, args: list) -> None:
         """Send message through WebSocket.
 
@@ -803,76 +1238,83 @@ class TvDatafeed:
         """
         message = self.__create_message(func, args)
         if self.ws_debug:
-            print(f"Sending: {message}")
-        ws.send(message)
+            print(f"Sending: {message.decode()}")
+        ws.send(message, opcode=ABNF.OPCODE_TEXT)
+
+    def __create_batch(self, messages: list[tuple[str, list]]) -> bytes:
+        """Join several (func, params) messages into one WebSocket payload.
+
+        The ``~m~<len>~m~`` header already delimits each message, so the
+        server accepts them concatenated in a single frame - one send, one
+        TLS record, instead of one per message.
+
+        Args:
+            messages: Ordered (func, params) pairs
+
+        Returns:
+            Concatenated messages ready to send
+        """
+        framed = [self.__create_message(func, params) for func, params in messages]
+        if self.ws_debug:
+            for message in framed:
+                print(f"Sending: {message.decode()}")
+        return b"".join(framed)
 
     @staticmethod
     def __parse_data(raw_data: str, is_return_dataframe: bool) -> list[list]:
-        """Parse raw WebSocket data into a list of OHLCV rows.
+        """Parse a full raw WebSocket payload into a list of OHLCV rows.
 
-        The paging loop accumulates one ``"s":[...]`` block per timescale_update
-        frame, so we collect bars from EVERY block (not just the first) and
-        dedup by timestamp - request_more_data can resend overlapping bars.
+        The fetch paths decode frames as they arrive (see ``_SeriesParser``);
+        this parses an already-accumulated payload the same way.
 
         Args:
             raw_data: Raw WebSocket response data
-            is_return_dataframe: Whether to format timestamp for DataFrame
+            is_return_dataframe: Whether to convert epochs to datetimes.
+                ``__create_df`` takes numeric epochs and converts them itself.
 
         Returns:
             List of [timestamp, open, high, low, close, volume] rows sorted
             oldest-first. Empty if the response carried no series data.
         """
-        bars_by_epoch: dict[int, list] = {}
-
-        for block in re.findall('"s":\\[(.+?)\\}\\]', raw_data):
-            for xi in block.split(',{"'):
-                parts = re.split("\\[|:|,|\\]", xi)
-                try:
-                    epoch = int(float(parts[4]))
-                except (ValueError, IndexError):
-                    continue
-
-                # Indices 5-9 are open, high, low, close, volume. Evaluate each
-                # value independently so a missing volume on one bar doesn't
-                # zero out the others (or subsequent bars).
-                values = []
-                for i in range(5, 10):
-                    try:
-                        values.append(float(parts[i]))
-                    except (ValueError, IndexError):
-                        values.append(0.0)
-                        if i == 9:
-                            logger.debug("No volume data available")
-
-                ts = (
-                    datetime.datetime.fromtimestamp(epoch, tz=datetime.timezone.utc)
-                    if is_return_dataframe
-                    else epoch
-                )
-                # Later frames carry newer values for a repeated timestamp.
-                bars_by_epoch[epoch] = [ts, *values]
-
-        return [bars_by_epoch[epoch] for epoch in sorted(bars_by_epoch)]
+        parser = _SeriesParser()
+        parser.feed(raw_data)
+        return parser.rows(is_return_dataframe)
 
     @staticmethod
-    def __create_df(parsed_data: list[list], symbol: str) -> pd.DataFrame | None:
+    def __create_df(parsed_data: list[list] | np.ndarray, symbol: str) -> pd.DataFrame | None:
         """Create pandas DataFrame from parsed OHLCV data.
 
+        The rows are converted in one vectorized pass: a single ``float64``
+        array for the values and one ``to_datetime`` call for the epochs. The
+        frame, indexed by ``datetime``, is then built in one constructor call
+        from typed column views.
+
         Args:
-            parsed_data: List of [timestamp, open, high, low, close, volume] rows
+            parsed_data: [epoch, open, high, low, close, volume] rows, as a
+                list or the ``(n, 6)`` array from ``_SeriesParser.array``
             symbol: Symbol name for the data
 
         Returns:
             DataFrame with OHLCV data or None on error
         """
         try:
-            df = pd.DataFrame(
-                parsed_data, columns=["datetime", "open", "high", "low", "close", "volume"]
-            ).set_index("datetime")
-            df.insert(0, "symbol", value=symbol)
-            return df
+            arr = np.asarray(parsed_data, dtype=np.float64)
+            return pd.DataFrame(
+                {
+                    "symbol": symbol,
+                    "open": arr[:, 1],
+                    "high": arr[:, 2],
+                    "low": arr[:, 3],
+                    "close": arr[:, 4],
+                    # A null volume (instrument has no volume data) is NaN here.
+                    "volume": np.nan_to_num(arr[:, 5], nan=0.0),
+                },
+                index=pd.DatetimeIndex(
+                    pd.to_datetime(arr[:, 0], unit="s", utc=True), name="datetime"
+                ),
+            )
 
-        except (AttributeError, IndexError, ValueError) as e:
+        except (AttributeError, IndexError, TypeError, ValueError) as e:
             logger.error("Failed to create DataFrame - check exchange and symbol: %s", e)
             return None
 
@@ -880,6 +1322,10 @@ class TvDatafeed:
     def __format_symbol(symbol: str, exchange: str, contract: int | None = None) -> str:
         """Format symbol string for TradingView.
 
+        Memoized: it is a pure function of its arguments and runs for every
+        fetch (and every request in ``get_hist_batch``). Unhashable arguments
+        skip the cache, so e.g. ``contract=[1]`` still raises ``ValueError``.
+
         Args:
             symbol: Symbol name
             exchange: Exchange name
@@ -891,6 +1337,19 @@ class TvDatafeed:
         Raises:
             ValueError: If contract type is invalid
         """
+        try:
+            return TvDatafeed.__format_symbol_cached(symbol, exchange, contract)
+        except TypeError:
+            return TvDatafeed.__format_symbol_cached.__wrapped__(symbol, exchange, contract)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024, typed=True)
+    def __format_symbol_cached(symbol: str, exchange: str, contract: int | None) -> str:
+        """Cached body of ``__format_symbol``.
+
+        ``typed=True`` keys ``contract=1.0`` apart from ``contract=1``, so the
+        float still raises instead of hitting the cached int result.
+        """
         match (symbol, contract):
             case (s, _) if ":" in s:
                 return s
@@ -938,7 +1397,7 @@ class TvDatafeed:
         # the cached auth_token was rejected as expired/invalid.
         for attempt in range(2):
             token_used = self.token
-            raw_data, auth_error = self._fetch_series(
+            series, auth_error = self._fetch_series(
                 symbol, interval_value, n_bars, extended_session
             )
 
@@ -950,15 +1409,15 @@ class TvDatafeed:
                 logger.error("TradingView rejected the request for %s", symbol)
                 return None
 
-            if not raw_data or "series_completed" not in raw_data:
+            if not series.completed:
                 logger.error("No valid data received for %s", symbol)
                 return None
 
-            parsed_data = self.__parse_data(raw_data, is_return_dataframe=True)
-            if not parsed_data:
+            bars = series.array()
+            if not len(bars):
                 logger.error("No series data in response for %s", symbol)
                 return None
-            return self.__create_df(parsed_data, symbol)
+            return self.__create_df(bars, symbol)
 
         return None
 
@@ -968,9 +1427,16 @@ class TvDatafeed:
         interval_value: str,
         n_bars: int,
         extended_session: bool,
-    ) -> tuple[str, bool]:
+    ) -> tuple[_SeriesParser, bool]:
         """Run one WebSocket fetch for a symbol's series.
 
+        Uses the persistent connection when it is free (see
+        :meth:`_series_connection`). If a reused connection fails before any
+        frame for this fetch's chart session arrives, it was most likely
+        dropped by the server while idle (an EOF, a close frame or only
+        buffered heartbeats), and the fetch is retried once on a fresh
+        connection.
+
         Args:
             symbol: Fully-formatted symbol (e.g. "NASDAQ:AAPL")
             interval_value: TradingView interval string
@@ -978,21 +1444,86 @@ class TvDatafeed:
             extended_session: Include extended trading hours
 
         Returns:
-            Tuple of (raw_data, auth_error). ``auth_error`` is True when
-            TradingView rejected the request (e.g. an expired token), which
-            signals the caller to refresh the token and retry.
+            Tuple of (series, auth_error). ``series`` holds the bars decoded
+            so far. ``auth_error`` is True when TradingView rejected the
+            request (e.g. an expired token), which signals the caller to
+            refresh the token and retry.
         """
-        session = self.__generate_session()
-        chart_session = self.__generate_chart_session()
-        raw_data = ""
-        auth_error = False
         # Capture the token once so the host choice and set_auth_token agree
         # even if another thread refreshes the token mid-fetch.
         token = self.token
+        series = _SeriesParser()
+        auth_error = False
 
-        try:
-            with self._websocket_connection(token) as ws:
-                for func, params in self._series_setup_messages(
+        for attempt in range(2):
+            chart_session = self.__generate_chart_session()
+            series, auth_error, reused = _SeriesParser(chart_session), False, False
+            try:
+                with self._series_connection(token, fresh=attempt > 0) as (ws, reused):
+                    auth_error = self.__stream_series(
+                        ws,
+                        series,
+                        token,
+                        reused,
+                        chart_session,
+                        symbol,
+                        interval_value,
+                        n_bars,
+                        extended_session,
+                    )
+                    if auth_error:
+                        self._discard_connection(ws)
+            except Exception as e:
+                if not reused or series.matched or attempt > 0:
+                    logger.error("Failed to get historical data for %s: %s", symbol, e)
+                    break
+                # Nothing for this fetch arrived on the reused connection; it
+                # was closed while idle, so retry once on a fresh one.
+                logger.debug("Persistent connection went stale - reconnecting for %s", symbol)
+                continue
+            break
+
+        return series, auth_error
+
+    def __stream_series(
+        self,
+        ws: WebSocket,
+        series: _SeriesParser,
+        token: str | None,
+        authenticated: bool,
+        chart_session: str,
+        symbol: str,
+        interval_value: str,
+        n_bars: int,
+        extended_session: bool,
+    ) -> bool:
+        """Request a series over an open connection and decode its frames.
+
+        Args:
+            ws: Open WebSocket connection
+            series: Parser each received message is fed to (owned by the
+                caller, so bars received before an exception survive it)
+            token: Token captured for this fetch
+            authenticated: The connection already sent ``set_auth_token``
+            chart_session: Chart session id ``series`` was created for
+            symbol: Fully-formatted symbol (e.g. "NASDAQ:AAPL")
+            interval_value: TradingView interval string
+            n_bars: Number of bars to request
+            extended_session: Include extended trading hours
+
+        Returns:
+            True if TradingView rejected the request (auth_error)
+
+        Raises:
+            Exception: Whatever ``recv`` raised (e.g. a timeout). The fetch did
+                not finish cleanly, so the connection must not be reused.
+        """
+        session = self.__generate_session() if self.include_quote_fields else None
+        auth_error = False
+
+        ws.send(
+            self.__create_batch(
+                self._series_setup_messages(
                     token,
                     session,
                     chart_session,
@@ -1000,54 +1531,59 @@ class TvDatafeed:
                     interval_value,
                     n_bars,
                     extended_session,
-                ):
-                    self.__send_message(ws, func, params)
-
-                # Collect response data, paging back with request_more_data:
-                # TradingView's initial series response is capped (~5k bars),
-                # so we keep asking for more until we have n_bars, the series is
-                # exhausted (no growth between pages), or we hit a safety cap.
-                # Bar timestamps are counted incrementally (per frame) rather
-                # than re-scanning the whole accumulated buffer each page.
-                logger.debug("Fetching data for %s...", symbol)
-                seen_bars: set[str] = set()
-                more_requests = 0
-                prev_bars = -1
-
-                while True:
-                    try:
-                        result = ws.recv()
-                    except Exception as e:
-                        logger.error("WebSocket receive error for %s: %s", symbol, e)
-                        break
-
-                    raw_data += result + "\n"
-
-                    # The server rejected us (commonly an expired token);
-                    # stop and let the caller decide whether to refresh.
-                    if "protocol_error" in result or "critical_error" in result:
-                        auth_error = True
-                        logger.warning("TradingView reported an error for %s: %s", symbol, result)
-                        break
-
-                    seen_bars.update(self._bar_timestamps(result))
-
-                    if "series_completed" in result:
-                        bars = len(seen_bars)
-                        if (
-                            bars >= n_bars
-                            or bars == prev_bars
-                            or more_requests >= self.__max_more_requests
-                        ):
-                            break
-                        prev_bars = bars
-                        more_requests += 1
-                        self.__send_message(ws, "request_more_data", [chart_session, "s1", 10000])
+                    authenticate=not authenticated,
+                ),
+            ),
+            opcode=ABNF.OPCODE_TEXT,
+        )
 
-        except Exception as e:
-            logger.error("Failed to get historical data for %s: %s", symbol, e)
+        # Decode response data as it arrives, paging back with
+        # request_more_data: TradingView's initial series response is capped
+        # (~5k bars), so we keep asking for more until we have n_bars, the
+        # series is exhausted (no growth between pages), or we hit a safety
+        # cap. Each message is parsed and dropped, never accumulated.
+        logger.debug("Fetching data for %s...", symbol)
+        more_requests = 0
+        prev_bars = -1
 
-        return raw_data, auth_error
+        while True:
+            try:
+                result = ws.recv()
+                # websocket-client returns "" for the server's close frame.
+                if not result:
+                    raise ConnectionError("connection closed by server")
+            except Exception as e:
+                logger.error("WebSocket receive error for %s: %s", symbol, e)
+                raise
+
+            page_completed = series.feed(result)
+            for beat in series.pop_heartbeats():
+                ws.send(self.__prepend_header(beat.encode()), opcode=ABNF.OPCODE_TEXT)
+
+            # The server rejected us (commonly an expired token);
+            # stop and let the caller decide whether to refresh.
+            if series.error:
+                auth_error = True
+                logger.warning("TradingView reported an error for %s: %s", symbol, result)
+                break
+
+            if page_completed:
+                bars = series.bar_count
+                if bars >= n_bars or bars == prev_bars or more_requests >= self.__max_more_requests:
+                    break
+                prev_bars = bars
+                more_requests += 1
+                self.__send_message(ws, "request_more_data", [chart_session, "s1", 10000])
+
+        if not auth_error:
+            # The connection may be reused for the next fetch: drop this
+            # fetch's sessions so the server stops streaming their updates.
+            cleanup = [("chart_delete_session", [chart_session])]
+            if session:
+                cleanup.append(("quote_delete_session", [session]))
+            ws.send(self.__create_batch(cleanup), opcode=ABNF.OPCODE_TEXT)
+
+        return auth_error
 
     async def __fetch_symbol_data(
         self,
@@ -1105,7 +1641,7 @@ class TvDatafeed:
         # One initial attempt plus one retry after a token refresh.
         for attempt in range(2):
             token_used = self.token
-            raw_data, auth_error = await self._async_fetch_series(
+            series, auth_error = await self._async_fetch_series(
                 symbol_formatted, interval_value, n_bars, extended_session
             )
 
@@ -1118,17 +1654,18 @@ class TvDatafeed:
                 logger.error("TradingView rejected the request for %s", symbol)
                 return None
 
-            if not raw_data or "series_completed" not in raw_data:
+            if not series.completed:
                 logger.error("No valid data received for %s", symbol)
                 return None
 
-            parsed_data = self.__parse_data(raw_data, dataFrame)
-            if not parsed_data:
+            # Epochs are kept numeric; __create_df converts them in one pass.
+            bars = series.array()
+            if not len(bars):
                 logger.error("No series data in response for %s", symbol)
                 return None
             if dataFrame:
-                return self.__create_df(parsed_data, symbol_formatted)
-            return parsed_data
+                return self.__create_df(bars, symbol_formatted)
+            return series.rows()
 
         return None
 
@@ -1138,15 +1675,15 @@ class TvDatafeed:
         interval_value: str,
         n_bars: int,
         extended_session: bool,
-    ) -> tuple[str, bool]:
+    ) -> tuple[_SeriesParser, bool]:
         """Run one async WebSocket fetch for a symbol's series.
 
         Returns:
-            Tuple of (raw_data, auth_error) - see :meth:`_fetch_series`.
+            Tuple of (series, auth_error) - see :meth:`_fetch_series`.
         """
-        session = self.__generate_session()
+        session = self.__generate_session() if self.include_quote_fields else None
         chart_session = self.__generate_chart_session()
-        raw_data = ""
+        series = _SeriesParser(chart_session)
         auth_error = False
         # Capture the token once so the host choice and set_auth_token agree
         # even if another coroutine refreshes the token mid-fetch.
@@ -1164,22 +1701,24 @@ class TvDatafeed:
                 # disable the websockets library's default 1 MB frame cap.
                 max_size=None,
             ) as websocket:
-                for func, params in self._series_setup_messages(
-                    token,
-                    session,
-                    chart_session,
-                    symbol_formatted,
-                    interval_value,
-                    n_bars,
-                    extended_session,
-                ):
-                    await websocket.send(self.__create_message(func, params))
+                await websocket.send(
+                    self.__create_batch(
+                        self._series_setup_messages(
+                            token,
+                            session,
+                            chart_session,
+                            symbol_formatted,
+                            interval_value,
+                            n_bars,
+                            extended_session,
+                        ),
+                    ),
+                    text=True,
+                )
 
-                # Fetch and parse raw data asynchronously, paging back with
+                # Fetch and decode data as it arrives, paging back with
                 # request_more_data until we have n_bars (see _fetch_series).
-                # Bar timestamps are counted incrementally per frame.
                 logger.debug("Fetching async data for %s...", symbol_formatted)
-                seen_bars: set[str] = set()
                 more_requests = 0
                 prev_bars = -1
 
@@ -1193,19 +1732,19 @@ class TvDatafeed:
                         logger.error("WebSocket receive error for %s: %s", symbol_formatted, e)
                         break
 
-                    raw_data += result + "\n"
+                    page_completed = series.feed(result)
+                    for beat in series.pop_heartbeats():
+                        await websocket.send(self.__prepend_header(beat.encode()), text=True)
 
-                    if "protocol_error" in result or "critical_error" in result:
+                    if series.error:
                         auth_error = True
                         logger.warning(
                             "TradingView reported an error for %s: %s", symbol_formatted, result
                         )
                         break
 
-                    seen_bars.update(self._bar_timestamps(result))
-
-                    if "series_completed" in result:
-                        bars = len(seen_bars)
+                    if page_completed:
+                        bars = series.bar_count
                         if (
                             bars >= n_bars
                             or bars == prev_bars
@@ -1215,13 +1754,16 @@ class TvDatafeed:
                         prev_bars = bars
                         more_requests += 1
                         await websocket.send(
-                            self.__create_message("request_more_data", [chart_session, "s1", 10000])
+                            self.__create_message(
+                                "request_more_data", [chart_session, "s1", 10000]
+                            ),
+                            text=True,
                         )
 
         except Exception as e:
             logger.error("Error fetching async data for %s: %s", symbol_formatted, e)
 
-        return raw_data, auth_error
+        return series, auth_error
 
     async def get_hist_async(
         self,
@@ -1371,9 +1913,58 @@ class TvDatafeed:
             )
         )
 
+    def get_hist_batch(
+        self,
+        queries: list[dict],
+        max_workers: int = 8,
+    ) -> list[pd.DataFrame | None]:
+        """Fetch several ``get_hist`` requests concurrently on threads.
+
+        The work is network-bound, so a thread pool turns the wall-clock time
+        from the sum of the per-symbol latencies into roughly the slowest one.
+        Each worker runs a normal ``get_hist``: one reuses the persistent
+        connection and the others open their own, so no WebSocket is shared
+        between threads. Token refreshes are already serialized by
+        ``_token_lock``. ``TvDatafeed.get_hist`` is called directly, so on a
+        ``TvDatafeedLive`` the workers don't queue on its live-feed lock.
+
+        Args:
+            queries: ``get_hist`` keyword arguments, one dict per request
+                (``symbol`` is required; the rest use ``get_hist`` defaults)
+            max_workers: Maximum number of concurrent fetches (default: 8).
+                Keep it modest to stay within TradingView's rate limits.
+
+        Returns:
+            One result per request, in the order of ``queries``: its
+            DataFrame, or None if that fetch failed. The same symbol can be
+            requested several times (e.g. with different intervals).
+
+        Raises:
+            ValueError: If a request has an invalid ``fut_contract``
+
+        Example:
+            >>> tv = TvDatafeed()
+            >>> aapl, btc = tv.get_hist_batch([
+            ...     {"symbol": "AAPL", "exchange": "NASDAQ", "n_bars": 100},
+            ...     {"symbol": "BTCUSDT", "exchange": "BINANCE", "interval": Interval.in_1_hour},
+            ... ])
+        """
+        # Validate every symbol before any network work starts.
+        for q in queries:
+            self.__format_symbol(q["symbol"], q.get("exchange", "NSE"), q.get("fut_contract"))
+        if not queries:
+            return []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda q: TvDatafeed.get_hist(self, **q), queries))
+
     def search_symbol(self, text: str, exchange: str = "") -> list[dict]:
         """Search for symbols on TradingView.
 
+        Successful results are cached per ``(text, exchange)`` for
+        ``_SEARCH_CACHE_TTL`` seconds, so repeated lookups (e.g. from a UI)
+        skip the HTTP round-trip. Errors are never cached.
+
         Args:
             text: Search text
             exchange: Filter by exchange (optional)
@@ -1385,22 +1976,68 @@ class TvDatafeed:
             >>> tv = TvDatafeed()
             >>> results = tv.search_symbol('CRUDE', 'MCX')
         """
+        key = (text, exchange)
+        with self._search_lock:
+            cached = self._search_cache.get(key)
+        # Cached entries are never mutated in place, so copy outside the lock.
+        if cached and time.monotonic() - cached[0] < self._SEARCH_CACHE_TTL:
+            return self._copy_search_results(cached[1])
+
         url = self.__search_url.format(text, exchange)
 
         try:
-            resp = requests.get(url, timeout=10)
+            resp = self._http.get(url, timeout=10)
             resp.raise_for_status()
+            results = resp.json(object_hook=self._strip_search_highlight)
 
-            # Remove HTML tags from response
-            clean_text = resp.text.replace("</em>", "").replace("<em>", "")
-            return json.loads(clean_text)
-
-        except requests.RequestException as e:
-            logger.error("Symbol search failed: %s", e)
-            return []
         except json.JSONDecodeError as e:
             logger.error("Failed to parse search results: %s", e)
             return []
+        except requests.RequestException as e:
+            logger.error("Symbol search failed: %s", e)
+            return []
+
+        # The cache stores its own copy, so the fresh results can be returned.
+        self._cache_search_results(key, results)
+        return results
+
+    def _cache_search_results(self, key: tuple[str, str], results: list[dict]) -> None:
+        """Store search results, evicting expired then oldest entries when full."""
+        entry = self._copy_search_results(results)
+        with self._search_lock:
+            cache = self._search_cache
+            now = time.monotonic()
+            cache.pop(key, None)
+            if len(cache) >= self._SEARCH_CACHE_SIZE:
+                for stale in [
+                    k for k, (ts, _) in cache.items() if now - ts >= self._SEARCH_CACHE_TTL
+                ]:
+                    del cache[stale]
+                while len(cache) >= self._SEARCH_CACHE_SIZE:
+                    del cache[next(iter(cache))]
+            cache[key] = (now, entry)
+
+    @staticmethod
+    def _copy_search_results(results: list[dict]) -> list[dict]:
+        """Copy cached search results so callers can't mutate the cached ones.
+
+        Deep, because results nest mutable values (e.g. a ``contracts`` list
+        of dicts).
+        """
+        return copy.deepcopy(results)
+
+    @classmethod
+    def _strip_search_highlight(cls, item: dict) -> dict:
+        """Remove the ``<em>`` match highlighting from a search result.
+
+        Used as the JSON ``object_hook``: it runs on each decoded object and
+        only touches its highlighted string fields.
+        """
+        for field in cls._SEARCH_HIGHLIGHT_FIELDS:
+            value = item.get(field)
+            if isinstance(value, str) and "<em>" in value:
+                item[field] = value.replace("<em>", "").replace("</em>", "")
+        return item
 
     def get_token(self) -> str | None:
         """Get current authentication token.
@@ -1414,14 +2051,17 @@ class TvDatafeed:
 if __name__ == "__main__":
     logging.basicConfig(level=logging.DEBUG)
     tv = TvDatafeed()
-    print(tv.get_hist("CRUDEOIL", "MCX", fut_contract=1))
-    print(tv.get_hist("NIFTY", "NSE", fut_contract=1))
-    print(
-        tv.get_hist(
-            "EICHERMOT",
-            "NSE",
-            interval=Interval.in_1_hour,
-            n_bars=500,
-            extended_session=False,
-        )
-    )
+    queries = [
+        {"symbol": "CRUDEOIL", "exchange": "MCX", "fut_contract": 1},
+        {"symbol": "NIFTY", "exchange": "NSE", "fut_contract": 1},
+        {
+            "symbol": "EICHERMOT",
+            "exchange": "NSE",
+            "interval": Interval.in_1_hour,
+            "n_bars": 500,
+            "extended_session": False,
+        },
+    ]
+    for query, df in zip(queries, tv.get_hist_batch(queries), strict=True):
+        print(query["symbol"])
+        print(df)